@@ -5,10 +5,9 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
-import os
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
@@ -16,8 +15,7 @@ app = FastAPI(title="Mergington High School API",
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+app.mount("/static", StaticFiles(directory=current_dir / "static"), name="static")
 
 # In-memory activity database
 activities = {
@@ -78,18 +76,24 @@ activities = {
 }
 
 
+def get_activities_db():
+    """Provide the activity database to route handlers"""
+    return activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
+def get_activities(activities: dict = Depends(get_activities_db)):
     return activities
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        activities: dict = Depends(get_activities_db)):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -108,7 +112,8 @@ def signup_for_activity(activity_name: str, email: str):
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             activities: dict = Depends(get_activities_db)):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -1,88 +1,103 @@
+import json
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+import pytest_asyncio
+from typing import Final
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, app, get_activities_db
 
-from app import app
+# Initial activities as (name, description, schedule, max_participants,
+# participants) rows, kept as constants so they are never rebuilt
+_INIT = (
+    ("Chess Club", "Learn strategies and compete in chess tournaments",
+     "Fridays, 3:30 PM - 5:00 PM", 12,
+     ("michael@mergington.edu", "daniel@mergington.edu")),
+    ("Programming Class", "Learn programming fundamentals and build software projects",
+     "Tuesdays and Thursdays, 3:30 PM - 4:30 PM", 20,
+     ("emma@mergington.edu", "sophia@mergington.edu")),
+    ("Gym Class", "Physical education and sports activities",
+     "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM", 30,
+     ("john@mergington.edu", "olivia@mergington.edu")),
+    ("Basketball Team", "Competitive basketball team for all skill levels",
+     "Mondays and Wednesdays, 4:00 PM - 5:30 PM", 15,
+     ("james@mergington.edu",)),
+    ("Tennis Club", "Tennis training and friendly matches",
+     "Tuesdays and Saturdays, 3:00 PM - 4:30 PM", 16,
+     ("alex@mergington.edu",)),
+    ("Drama Club", "Acting, theater production, and performance art",
+     "Thursdays, 4:00 PM - 5:30 PM", 25,
+     ("grace@mergington.edu", "liam@mergington.edu")),
+    ("Art Studio", "Painting, drawing, and creative visual arts",
+     "Wednesdays, 3:30 PM - 5:00 PM", 18,
+     ("isabella@mergington.edu",)),
+    ("Debate Team", "Develop critical thinking and public speaking skills",
+     "Mondays and Fridays, 3:30 PM - 4:30 PM", 14,
+     ("lucas@mergington.edu", "mia@mergington.edu")),
+    ("Science Club", "Explore science experiments and research projects",
+     "Tuesdays, 3:30 PM - 5:00 PM", 20,
+     ("noah@mergington.edu",)),
+)
 
 
-@pytest.fixture
-def client():
-    """Fixture to provide a TestClient for the FastAPI app"""
-    return TestClient(app)
+def _build_initial() -> dict:
+    """Build the activities dict from the initial rows"""
+    return {
+        name: {
+            "description": description,
+            "schedule": schedule,
+            "max_participants": max_participants,
+            "participants": list(participants),
+        }
+        for name, description, schedule, max_participants, participants in _INIT
+    }
+
+
+# Built once at import as the reference for the initial response body
+_INITIAL_STATE: Final[dict] = _build_initial()
+
+# GET /activities body for the initial state, serialized the way FastAPI's
+# JSONResponse renders it so responses can be compared byte for byte
+_EXPECTED_JSON_BYTES: Final[bytes] = json.dumps(
+    _INITIAL_STATE, ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Fixture to provide an async client shared across the test session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def initial_activities_bytes():
+    """Fixture to provide the expected GET /activities body for the initial state"""
+    return _EXPECTED_JSON_BYTES
 
 
 @pytest.fixture
 def reset_activities():
-    """Fixture to reset activities to initial state before each test"""
-    from app import activities
-    
-    initial_state = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team for all skill levels",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis training and friendly matches",
-            "schedule": "Tuesdays and Saturdays, 3:00 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting, theater production, and performance art",
-            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["grace@mergington.edu", "liam@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and creative visual arts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking skills",
-            "schedule": "Mondays and Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 14,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore science experiments and research projects",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["noah@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(initial_state)
-    
-    yield
-    
-    # Reset after test
-    activities.clear()
-    activities.update(initial_state)
+    """Fixture to give each test its own copy of the initial activities"""
+    # The app's module-level activities are never touched, so tests stay
+    # isolated from each other and can run in parallel workers
+    state = _build_initial()
+    app.dependency_overrides[get_activities_db] = lambda: state
+    yield state
+    app.dependency_overrides.pop(get_activities_db, None)
+
+
+@pytest.fixture(scope="session")
+def read_only_activities():
+    """Fixture to provide the app's own activities for tests that only read them"""
+    # No per-test copy is needed: without a dependency override the app serves
+    # its module-level activities, which mutating tests never touch
+    return activities
+
+
+@pytest_asyncio.fixture(scope="session")
+async def activities_json(client, read_only_activities):
+    """Fixture to provide the parsed GET /activities response for read-only tests"""
+    response = await client.get("/activities")
+    return response.json()